@@ -2,16 +2,69 @@
 
 import os
 import re
+import sys
+import time
 import argparse
+import functools
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from dotenv import load_dotenv
-from datetime import datetime
 
 load_dotenv()
 
 UNDO_LOG_PATH = "undo_log.txt"
 
+_PRINT_BATCH = 1024
+
+_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
+@functools.lru_cache(maxsize=256)
+def _get_pattern(regex, flags=0):
+    """
+    Compile a regex, memoizing the result across repeated invocations.
+
+    Args:
+        regex (str): The pattern string to compile.
+        flags (int): Optional re flags.
+
+    Returns:
+        re.Pattern: The compiled pattern.
+    """
+
+    return re.compile(regex, flags)
+
+def _dir_prefix(directory):
+    """
+    Return a directory path with a trailing separator for cheap path concatenation.
+
+    Args:
+        directory (str): The directory path.
+
+    Returns:
+        str: The path ending in os.sep, so child paths can be built by plain concat.
+    """
+
+    return directory if directory.endswith(os.sep) else directory + os.sep
+
+def _extract_year(filename):
+    """
+    Extract the year from a YYYY-MM-DD date in a filename, or None if absent.
+
+    Checks for a date prefix with plain character tests first, which is far
+    cheaper than the regex engine; falls back to the regex only when the
+    filename could hold a date somewhere mid-string.
+    """
+
+    if len(filename) >= 10 and filename[4] == '-' and filename[7] == '-' \
+            and filename[:4].isdigit() and filename[5:7].isdigit() and filename[8:10].isdigit():
+        return filename[:4]
+    if filename.find('-', 4) != -1:
+        match = _DATE_RE.search(filename)
+        if match:
+            return match.group(1)
+    return None
+
 def parse_args():
     """
     Parse command-line arguments provided by the user.
@@ -29,6 +82,8 @@ def parse_args():
     parser.add_argument("--undo", action="store_true", help="Undo the last action")
     parser.add_argument("--natural", help="Natural language instruction to be interpreted by OpenAI")
     parser.add_argument("--auto-suggest", action="store_true", help="Use GPT to suggest how to organize the directory")
+    parser.add_argument("--workers", "-w", type=int, default=1, help="Threads used to apply moves; raise on network filesystems (default: 1)")
+    parser.add_argument("--no-undo", action="store_true", help="Skip writing the undo log; the operation cannot be undone")
     return parser.parse_args()
 
 def analyze_directory(directory):
@@ -39,26 +94,30 @@ def analyze_directory(directory):
         directory (str): The path to the target directory.
 
     Returns:
-        defaultdict: A dictionary containing lists of file extensions and extracted dates (if found).
-    """
-
-    file_data = defaultdict(list)
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        if os.path.isfile(filepath):
-            extension = filename.split('.')[-1] if '.' in filename else 'no_extension'
-            file_data["extension"].append((filename, extension))
-
-            # Try to get date from filename first
-            date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})', filename)
-            if date_match:
-                year = date_match.group(1)
-            else:
-                # Fall back to file's last modified timestamp
-                mod_time = os.path.getmtime(filepath)
-                year = datetime.fromtimestamp(mod_time).strftime("%Y")
-
-            file_data["dates"].append((filename, year))
+        dict: Parallel "names", "exts", and "years" lists indexed per file, plus a
+            "by_ext" mapping of extension to the filenames that carry it.
+    """
+
+    file_data = {"names": [], "exts": [], "years": [], "by_ext": defaultdict(list)}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False):
+                filename = entry.name
+                _, dot, extension = filename.rpartition('.')
+                if not dot:
+                    extension = 'no_extension'
+
+                # Try to get date from filename first
+                year = _extract_year(filename)
+                if year is None:
+                    # Fall back to file's last modified timestamp
+                    mod_time = entry.stat(follow_symlinks=False).st_mtime
+                    year = str(time.localtime(mod_time).tm_year)
+
+                file_data["names"].append(filename)
+                file_data["exts"].append(extension)
+                file_data["years"].append(year)
+                file_data["by_ext"][extension].append(filename)
     return file_data
 
 def provide_suggestions(file_data):
@@ -66,28 +125,30 @@ def provide_suggestions(file_data):
     Generate organization suggestions based on the analyzed file metadata.
 
     Args:
-        file_data (defaultdict): The collected file extensions and dates.
+        file_data (dict): The collected file names, extensions, and years.
 
     Returns:
         list: A list of suggestion dictionaries for organizing files.
     """
 
     suggestions = []
-    ext_set = set(ext for _, ext in file_data['extension'])
+    ext_set = set(file_data["exts"])
     for ext in ext_set:
         suggestions.append({"type": "extension", "extension": ext, "description": f"Move all .{ext} files into '{ext}/'"})
-    if file_data.get('dates'):
+    if file_data["years"]:
         suggestions.append({"type": "year", "description": "Group files into folders based on year in filename"})
     return suggestions
 
-def prompt_user_for_reorganization(suggestions, directory, file_data):
+def prompt_user_for_reorganization(suggestions, directory, file_data, workers=1, log_undo=True):
     """
     Prompt the user with suggested file organization options and execute the chosen operation.
 
     Args:
         suggestions (list): List of reorganization suggestions.
         directory (str): The path to the directory.
-        file_data (defaultdict): Metadata extracted from filenames.
+        file_data (dict): Metadata extracted from filenames.
+        workers (int): Threads used to apply any chosen moves.
+        log_undo (bool): If False, skip writing the undo log.
     """
 
     print("\nHere are some suggestions to reorganize your directory:")
@@ -108,60 +169,76 @@ def prompt_user_for_reorganization(suggestions, directory, file_data):
     else:
         selected = suggestions[choice - 1]
         if selected['type'] == 'extension':
-            move_by_extension(directory, selected['extension'], file_data['extension'])
+            move_by_extension(directory, selected['extension'], file_data, workers=workers, log_undo=log_undo)
         elif selected['type'] == 'year':
-            group_by_year(directory, file_data['dates'])
+            group_by_year(directory, file_data, workers=workers, log_undo=log_undo)
 
-def move_by_extension(directory, target_ext, extension_data, dry_run=False):
+def move_by_extension(directory, target_ext, file_data, dry_run=False, workers=1, log_undo=True):
     """
     Move files with a specific extension into a subfolder named after the extension.
 
     Args:
         directory (str): The path to the target directory.
         target_ext (str): The file extension to group by.
-        extension_data (list): List of (filename, extension) tuples.
+        file_data (dict): Analyzed metadata with a "by_ext" extension-to-filenames mapping.
         dry_run (bool): If True, preview actions without applying changes.
+        workers (int): Threads used to apply the moves.
+        log_undo (bool): If False, skip writing the undo log.
     """
 
     target_dir = os.path.join(directory, target_ext)
-    if not dry_run:
+    prefix = _dir_prefix(directory)
+    target_prefix = target_dir + os.sep
+    moves = [(prefix + filename, target_prefix + filename)
+             for filename in file_data["by_ext"][target_ext]]
+    if dry_run:
+        sys.stdout.writelines(f"Would move: {old} -> {new}\n" for old, new in moves)
+    else:
         os.makedirs(target_dir, exist_ok=True)
-    for filename, ext in extension_data:
-        if ext == target_ext:
-            old = os.path.join(directory, filename)
-            new = os.path.join(target_dir, filename)
-            if dry_run:
-                print(f"Would move: {old} -> {new}")
-            else:
-                os.rename(old, new)
-                log_move(old, new)
-                print(f"Moved: {old} -> {new}")
-
-def group_by_year(directory, date_data, dry_run=False):
+        perform_moves(moves, workers=workers)
+        if log_undo:
+            log_moves(moves)
+
+def group_by_year(directory, file_data, dry_run=False, workers=1, log_undo=True):
     """
     Move files into subfolders based on the year extracted from their filenames.
 
     Args:
         directory (str): The target directory path.
-        date_data (list): List of (filename, year) tuples.
+        file_data (dict): Analyzed metadata with parallel "names" and "years" lists.
         dry_run (bool): If True, preview actions without applying changes.
+        workers (int): Threads used to apply the moves.
+        log_undo (bool): If False, skip writing the undo log.
     """
 
-    for filename, year in date_data:
-        year_dir = os.path.join(directory, year)
-        old = os.path.join(directory, filename)
-        new = os.path.join(year_dir, filename)
-        if dry_run:
-            print(f"Would move: {old} -> {new}")
-        else:
-            os.makedirs(year_dir, exist_ok=True)
-            os.rename(old, new)
-            log_move(old, new)
-            print(f"Moved: {old} -> {new}")
-    if not dry_run:
+    prefix = _dir_prefix(directory)
+    moves = [(prefix + filename, prefix + year + os.sep + filename)
+             for filename, year in zip(file_data["names"], file_data["years"])]
+    if dry_run:
+        sys.stdout.writelines(f"Would move: {old} -> {new}\n" for old, new in moves)
+    else:
+        for year in set(file_data["years"]):
+            os.makedirs(os.path.join(directory, year), exist_ok=True)
+        perform_moves(moves, workers=workers)
+        if log_undo:
+            log_moves(moves)
         print("Files grouped by year.")
 
-def rename_files(directory, regex, replace, dry_run=False):
+def list_files(directory):
+    """
+    List the names of regular files in a directory.
+
+    Args:
+        directory (str): The path to the directory to scan.
+
+    Returns:
+        list: Filenames of regular (non-symlink) files in the directory.
+    """
+
+    with os.scandir(directory) as entries:
+        return [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
+
+def rename_files(directory, regex, replace, dry_run=False, filenames=None, workers=1, log_undo=True):
     """
     Rename files matching a regex pattern, replacing matched parts according to user input.
 
@@ -170,21 +247,28 @@ def rename_files(directory, regex, replace, dry_run=False):
         regex (str): The regex pattern to search in filenames.
         replace (str): Replacement string or pattern.
         dry_run (bool): If True, preview actions without applying changes.
+        filenames (list): Optional pre-scanned filenames; skips a fresh directory scan when given.
+        workers (int): Threads used to apply the renames.
+        log_undo (bool): If False, skip writing the undo log.
     """
 
-    for filename in os.listdir(directory):
-        if re.search(regex, filename):
-            new_name = re.sub(regex, replace, filename)
-            old_path = os.path.join(directory, filename)
-            new_path = os.path.join(directory, new_name)
-            if dry_run:
-                print(f"Would rename: {old_path} -> {new_path}")
-            else:
-                os.rename(old_path, new_path)
-                log_move(old_path, new_path)
-                print(f"Renamed: {old_path} -> {new_path}")
+    pattern = _get_pattern(regex)
+    if filenames is None:
+        filenames = list_files(directory)
+    prefix = _dir_prefix(directory)
+    moves = []
+    for filename in filenames:
+        new_name, matched = pattern.subn(replace, filename)
+        if matched:
+            moves.append((prefix + filename, prefix + new_name))
+    if dry_run:
+        sys.stdout.writelines(f"Would rename: {old} -> {new}\n" for old, new in moves)
+    else:
+        perform_moves(moves, verb="Renamed", workers=workers)
+        if log_undo:
+            log_moves(moves)
 
-def move_files_by_regex(directory, regex, folder, dry_run=False):
+def move_files_by_regex(directory, regex, folder, dry_run=False, filenames=None, workers=1, log_undo=True):
     """
     Move files matching a regex pattern into a specific target folder.
 
@@ -193,33 +277,91 @@ def move_files_by_regex(directory, regex, folder, dry_run=False):
         regex (str): Regex pattern to match files.
         folder (str): Destination folder name.
         dry_run (bool): If True, preview actions without applying changes.
+        filenames (list): Optional pre-scanned filenames; skips a fresh directory scan when given.
+        workers (int): Threads used to apply the moves.
+        log_undo (bool): If False, skip writing the undo log.
     """
 
+    pattern = _get_pattern(regex)
     target_dir = os.path.join(directory, folder)
-    if not dry_run:
+    if filenames is None:
+        filenames = list_files(directory)
+    prefix = _dir_prefix(directory)
+    target_prefix = target_dir + os.sep
+    moves = [(prefix + filename, target_prefix + filename)
+             for filename in filenames if pattern.search(filename)]
+    if dry_run:
+        sys.stdout.writelines(f"Would move: {old} -> {new}\n" for old, new in moves)
+    else:
         os.makedirs(target_dir, exist_ok=True)
-    for filename in os.listdir(directory):
-        if re.search(regex, filename):
-            old_path = os.path.join(directory, filename)
-            new_path = os.path.join(target_dir, filename)
-            if dry_run:
-                print(f"Would move: {old_path} -> {new_path}")
-            else:
-                os.rename(old_path, new_path)
-                log_move(old_path, new_path)
-                print(f"Moved: {old_path} -> {new_path}")
+        perform_moves(moves, workers=workers)
+        if log_undo:
+            log_moves(moves)
+
+def perform_moves(moves, verb="Moved", workers=1):
+    """
+    Apply a batch of file moves, optionally with a thread pool.
+
+    Each move is a single metadata operation, so threads only help where
+    per-call latency dominates (e.g. SMB/NFS mounts); the default of one
+    worker keeps local operations serial.
+
+    Progress messages are buffered and flushed to stdout in batches of
+    _PRINT_BATCH rather than printed per move, which matters on
+    line-buffered terminals and piped output.
 
-def log_move(old_path, new_path):
+    Args:
+        moves (list): List of (old_path, new_path) tuples to apply.
+        verb (str): Label printed for each completed move.
+        workers (int): Number of threads; 1 applies moves serially.
     """
-    Log a file move action to enable undo functionality.
+
+    def _move(pair):
+        old_path, new_path = pair
+        os.replace(old_path, new_path)
+        return f"{verb}: {old_path} -> {new_path}\n"
+
+    def _emit(messages):
+        lines = []
+        for message in messages:
+            lines.append(message)
+            if len(lines) >= _PRINT_BATCH:
+                sys.stdout.writelines(lines)
+                lines.clear()
+        sys.stdout.writelines(lines)
+
+    if workers > 1 and len(moves) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _emit(executor.map(_move, moves))
+    else:
+        _emit(map(_move, moves))
+
+def log_moves(moves):
+    """
+    Log a batch of file move actions to enable undo functionality.
 
     Args:
-        old_path (str): Original file path before moving.
-        new_path (str): New file path after moving.
+        moves (list): List of (old_path, new_path) tuples, in the order the moves were made.
     """
 
+    if not moves:
+        return
     with open(UNDO_LOG_PATH, "a") as log:
-        log.write(f"{new_path} -> {old_path}\n")
+        log.writelines(f"{new_path} -> {old_path}\n" for old_path, new_path in moves)
+
+def _is_empty_dir(path):
+    """
+    Check whether a directory is empty by pulling a single scandir entry.
+
+    Args:
+        path (str): Directory to check.
+
+    Returns:
+        bool: True if the directory has no entries.
+    """
+
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
 
 def undo_last_action():
     """
@@ -232,16 +374,22 @@ def undo_last_action():
         return
     moved_dirs = set()
     with open(UNDO_LOG_PATH, "r") as log:
-        moves = [line.strip().split(" -> ") for line in log if "->" in line]
-    for src, dst in moves:
-        moved_dirs.add(os.path.dirname(src))
-        if os.path.exists(src):
-            os.rename(src, dst)
-            print(f"Moved back: {src} -> {dst}")
-    for dir_path in moved_dirs:
-        if os.path.exists(dir_path) and os.path.isdir(dir_path) and not os.listdir(dir_path):
-            os.rmdir(dir_path)
-            print(f"Removed empty folder: {dir_path}")
+        for line in log:
+            sep = line.find(" -> ")
+            if sep < 0:
+                continue
+            src, dst = line[:sep], line[sep + 4:].rstrip("\n")
+            moved_dirs.add(os.path.dirname(src))
+            if os.path.exists(src):
+                os.replace(src, dst)
+                print(f"Moved back: {src} -> {dst}")
+    for dir_path in sorted(moved_dirs, key=lambda p: -p.count(os.sep)):
+        try:
+            if _is_empty_dir(dir_path):
+                os.rmdir(dir_path)
+                print(f"Removed empty folder: {dir_path}")
+        except OSError:
+            continue
     os.remove(UNDO_LOG_PATH)
     print("Undo complete.")
 
@@ -256,8 +404,8 @@ def summarize_directory(directory):
         str: A formatted string listing all files, or an error message if the directory cannot be read.
     """
     try:
-        files = os.listdir(directory)
-        files = [f for f in files if os.path.isfile(os.path.join(directory, f))]
+        with os.scandir(directory) as entries:
+            files = [entry.name for entry in entries if entry.is_file(follow_symlinks=False)]
         return "\n".join(f"- {f}" for f in files)
     except Exception as e:
         return f"(Could not read directory: {e})"
@@ -443,13 +591,13 @@ def main():
         if not args.regex or not args.replace:
             print("Both --regex and --replace are required for renaming.")
             return
-        rename_files(directory, args.regex, args.replace, dry_run=args.dry_run)
+        rename_files(directory, args.regex, args.replace, dry_run=args.dry_run, workers=args.workers, log_undo=not args.no_undo)
 
     elif args.action == "move":
         if not args.regex or not args.replace:
             print("Both --regex and --replace are required for moving.")
             return
-        move_files_by_regex(directory, args.regex, args.replace, dry_run=args.dry_run)
+        move_files_by_regex(directory, args.regex, args.replace, dry_run=args.dry_run, workers=args.workers, log_undo=not args.no_undo)
 
     elif args.auto_suggest:
         suggestions = generate_ai_organization_suggestions(args.directory or "test_dir")
@@ -463,7 +611,7 @@ def main():
         file_data = analyze_directory(directory)
         suggestions = provide_suggestions(file_data)
         if suggestions:
-            prompt_user_for_reorganization(suggestions, directory, file_data)
+            prompt_user_for_reorganization(suggestions, directory, file_data, workers=args.workers, log_undo=not args.no_undo)
         else:
             print("No actionable patterns found.")
 